@@ -1,5 +1,6 @@
 from setuptools import setup, find_namespace_packages
 from typing import Union, List
+import ast
 
 # Load metadata from _metadata.py
 __title__ : str
@@ -31,7 +32,7 @@ with open('requirements.txt') as f:
         elif line.startswith('#?'):
             # Marks beginning of requirements for specific extras
             context_skip = False
-            context_extras = eval(line[2:])
+            context_extras = ast.literal_eval(line[2:].strip()) # Only literals, never evaluate code from the file
             extra : str
             for extra in context_extras:
                 extras_require.setdefault(extra, [])
@@ -1,3 +1,19 @@
 from ._metadata import *
 
-from .logging import *
\ No newline at end of file
+# Imported by name, since a star-import would resolve the lazily provided names in __all__ right away
+from .logging import (
+    add_logging_level,
+    CustomFormatter,
+    CustomColourFormatter,
+    is_docker,
+    stream_supports_colour,
+    get_handler,
+    get_buffered_handler,
+    setup_logging,
+)
+from .logging import __all__, __getattr__
+
+
+def __dir__():
+    # Also list the names provided lazily by submodules (see logging.__getattr__)
+    return sorted(set(globals()) | set(__all__))
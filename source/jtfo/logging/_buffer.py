@@ -0,0 +1,122 @@
+# Buffered handler, kept separate so logging.handlers is only imported when it is used
+# Only imported when needed, by get_buffered_handler or on first access through the jtfo.logging module (see logging.__getattr__)
+from typing import List, Union
+import logging
+import logging.handlers
+import threading
+
+# Emit implementations that only write the formatted record to the stream, so writes can be batched
+# (FileHandler just opens its stream first, if it was delayed)
+_BATCHABLE_EMITS = (logging.StreamHandler.emit, logging.FileHandler.emit)
+
+
+class BufferedHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler writing its buffered records to the stream of a StreamHandler or FileHandler in batches.
+
+    The default implementation of `flush` passes every buffered record on to the target handler
+    by itself, which still writes and flushes the stream once per record.
+    Instead, all buffered records are formatted first and written to the stream of the target
+    with a single write and flush, while holding the lock of the target.
+    Other targets, including subclasses with their own emit (like the rotating file handlers) and
+    targets without an open stream, get the records passed on one by one.
+
+    Optionally, a daemon thread flushes the buffer in a fixed interval, so buffered records still show up promptly.
+    The thread is stopped when the handler gets closed, for example by `logging.shutdown` at exit.
+
+    See Also
+    --------
+    get_buffered_handler
+    logging.handlers.MemoryHandler
+
+    """
+    def __init__(self, capacity : int, flush_level : int, target : logging.Handler, flush_interval : Union[float, None] = None):
+        """
+        Constructor, calling super constructor of logging.handlers.MemoryHandler class,
+        and starting the flush thread if a flush interval is given.
+
+        Parameters
+        ----------
+        capacity : int
+            Number of records to buffer before they are written.
+        flush_level : int
+            Logging level at which the buffer is written immediately.
+        target : logging.Handler
+            The handler the buffered records are written with.
+        flush_interval : `float` or `None`, optional
+            Seconds to wait between periodic flushes. If `None` (default), the buffer is only
+            written once it is full, a record with `flush_level` or above is logged, or the handler is closed.
+
+        """
+        super().__init__(capacity, flush_level, target, flushOnClose=True)
+        self._stop_flushing = threading.Event()
+
+        if flush_interval is not None:
+            thread = threading.Thread(target=self._flush_periodically, args=(flush_interval,), name='jtfo-logging-flush', daemon=True)
+            thread.start()
+
+    def _flush_periodically(self, interval : float) -> None:
+        """
+        Flushes the buffer in a fixed interval, until the handler gets closed.
+
+        Parameters
+        ----------
+        interval : float
+            Seconds to wait between flushes.
+
+        """
+        while not self._stop_flushing.wait(interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Overrides flush method from logging.handlers.MemoryHandler, writing all buffered records
+        to the stream of the target at once.
+
+        See Also
+        --------
+        logging.handlers.MemoryHandler.flush
+
+        """
+        with self.lock:
+            target = self.target
+            if getattr(type(target), 'emit', None) not in _BATCHABLE_EMITS or target.stream is None:
+                # Closed, custom emit (like the rotating file handlers) or no open stream, pass records on one by one
+                super().flush()
+                return
+
+            records, self.buffer = self.buffer, []
+            lines : List[str] = []
+            with target.lock:
+                for record in records:
+                    # Same as target.handle(record), but collecting the formatted records
+                    rv = target.filter(record)
+                    if not rv: continue
+                    if isinstance(rv, logging.LogRecord): record = rv
+
+                    try:
+                        lines.append(target.format(record) + target.terminator)
+
+                    except Exception:
+                        target.handleError(record)
+
+                if not lines: return
+
+                try:
+                    target.stream.write(''.join(lines))
+                    target.flush()
+
+                except Exception:
+                    target.handleError(records[-1])
+
+    def close(self) -> None:
+        """
+        Overrides close method from logging.handlers.MemoryHandler, also stopping the flush thread.
+
+        See Also
+        --------
+        logging.handlers.MemoryHandler.close
+
+        """
+        self._stop_flushing.set()
+        super().close()
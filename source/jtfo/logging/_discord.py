@@ -0,0 +1,253 @@
+# Extra functionality for "discord.py"
+# Only imported on first access of one of its names through the jtfo.logging module (see logging.__getattr__)
+from typing import Any
+import logging
+
+from discord.abc import GuildChannel
+from discord import Embed, Colour
+from discord.ext import tasks
+
+from asyncio import get_running_loop, AbstractEventLoop, Queue
+from datetime import datetime, timezone
+import re
+
+# Lookalike replacement for dots, used to fix Discord's syntax highlighting for 'profile'
+_DOT_FIX_RE = re.compile(r'\.(?=\D)')
+
+# Maximum length of an embed description allowed by Discord
+_MAX_DESCRIPTION_LENGTH = 4096
+# The replacements turn at most two characters into one, so text cut at this length
+# still exceeds the maximum length afterwards, and gets truncated the same way as the full text
+_TRUNCATE_BOUND = 2 * (_MAX_DESCRIPTION_LENGTH + 1)
+
+
+class AsyncQueueHandler(logging.Handler):
+    """
+    Logging handler emitting log records into internal asyncio.Queue instance.
+    Queue has to be read externally using async_get.
+
+    Used together with the CustomEmbedFormatter to create formatted message 
+    logging for use with Discord.py bots.
+
+    Warnings
+    --------
+    The queue size is limited, and once it is full the oldest message gets dropped to make room for the new one.
+    The implementation is responsible for calling async_get to get elements from the queue fast enough.
+    This probably isn't suited for high-performance logging, but it should be fine for the purpose of occasionally logging
+    formatted messages to a Discord channel.
+
+    See Also
+    --------
+    register_discord_handlers
+    register_discord_handler
+    logging.Handler
+    asyncio.Queue
+
+    """
+    def __init__(self, loop : AbstractEventLoop, level : int, max_queue_size : int = 1024):
+        """
+        Initialized async queue and calls super constructur.
+
+        Parameters
+        ----------
+        loop : AbstractEventLoop
+            The asyncio event loop to use (threadsafe) when putting into the queue / emitting log records.
+        level : int
+            Minimum logging level for which to emit logging records, passed to super constructor.
+        max_queue_size : int, optional
+            Maximum number of messages kept in the queue before the oldest ones get dropped. Defaults to 1024.
+
+        """
+        self._loop : AbstractEventLoop = loop
+        self._queue : Queue = Queue(max_queue_size)
+        self._dropped : int = 0
+        super().__init__(level)
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of messages that have been dropped because the queue was full.
+
+        """
+        return self._dropped
+
+    def emit(self, record : logging.LogRecord) -> None:
+        """
+        Called when a record has a high enough level to be sent.
+        As long as the loop isn't closed, formats record and puts the resulting message
+        into the async queue.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            The record to be formatted and logged.
+
+        """
+        if self._loop.is_closed(): return
+
+        try:
+            msg : Any = self.format(record)
+
+            # Enqueue without blocking, avoiding a coroutine and future for every record
+            self._loop.call_soon_threadsafe(self._put_nowait, msg)
+
+        except Exception:
+            self.handleError(record)
+
+    def _put_nowait(self, msg : Any) -> None:
+        """
+        Puts the message into the async queue, dropping the oldest message if it is full.
+        Has to be called from within the event loop.
+
+        Parameters
+        ----------
+        msg : Any
+            The formatted log message.
+
+        """
+        if self._queue.full():
+            self._queue.get_nowait()
+            self._dropped += 1
+
+        self._queue.put_nowait(msg)
+
+    async def async_get(self) -> Any:
+        """
+        Retrieves the next log message from the async queue.
+        If there is none, will wait until one is available.
+
+        See Also
+        --------
+        Queue.get
+
+        """
+        return await self._queue.get()
+
+
+class CustomEmbedFormatter(logging.Formatter):
+    """
+    Custom embed formatter for logging to Discord channels.
+
+    Used together with AsyncQueueHandler to create formatted message 
+    logging for use with Discord.py bots.
+
+    Info
+    ----
+    The embeds are formatted to make them visually more appealing.
+    First, the colour for the embed is chosen based on the log level:
+        NOTSET   (0) : Colour.dark_gray()
+        DEBUG    (10): Colour.purple()
+        INFO     (20): Colour.default()
+        NOTICE   (25): Colour.green()
+        WARNING  (30): Colour.yellow()
+        ERROR    (40): Colour.red()
+        CRITICAL (50): Colour.dark_red()
+    The log level name and the name of the logger are set as the embed's title.
+    The created date of the record is turned into a timezone-aware timestamp and will
+    display at the bottom of each embed.
+    Lastly, the description is put into a code box, using 'profile' as the language for highlighting.
+    If the record contains exc_info it will be appended in a second text box, also using 'profile' for highlighting.
+    If the extra-dictionary is present and contains a 'raw_msg' key with a string value, 
+    it will be appended to the embed description as a multi-line quote.
+    That way, custom formatting for it can still be rendered if necessary.
+
+    Warning
+    -------
+    To fix some issues with Discord's syntax highlighting for 'profile',
+    a couple of characters get replaced with lookalikes in the text contents:
+        ' ('        -> '\uFF08' (Fullwidth left parenthesis)
+        '('         -> '\uFF08' (Fullwidth left parenthesis)
+        r'\.(?=\D)' -> '\u2024' (One-dot leader)
+    This is fine for displaying, but needs to be considered before doing anything
+    else with the messages!
+
+    """
+    def __init__(self):
+        self._level_colours = {
+            logging.NOTSET:   Colour.dark_gray(),
+            logging.DEBUG:    Colour.purple(),
+            logging.INFO:     Colour.default(),
+            logging.NOTICE:   Colour.green(), # Custom logging level
+            logging.WARNING:  Colour.yellow(),
+            logging.ERROR:    Colour.red(),
+            logging.CRITICAL: Colour.dark_red(),
+        }
+
+    def format(self, record : logging.LogRecord) -> Embed:
+        embed_title = f"**{record.levelname}** - {record.name}"
+        embed_colour = self._level_colours.get(record.levelno)
+        embed_timestamp = datetime.fromtimestamp(record.created, timezone.utc) # Discord converts to UTC anyway
+        description_parts = []
+
+        message = record.getMessage()
+        if len(message) > 0:
+            description_parts.append(f"```profile\n{message}```") # Replace number sign
+
+        if record.exc_info and not record.exc_text:
+            # Shares the cached stacktrace with the stream formatters (see logging._BaseFormatter.format)
+            record.exc_text = self.formatException(record.exc_info)
+
+        if record.exc_text:
+            # Add stacktrace as textbox
+            description_parts.append(f"```profile\n{record.exc_text}```")
+
+        embed_description = ''.join(description_parts)
+
+        if len(embed_description) > _TRUNCATE_BOUND:
+            # Cut off text that can't fit anyway, so the replacements don't have to process it
+            embed_description = embed_description[:_TRUNCATE_BOUND]
+
+        if len(embed_description) > 0:
+            # Hack: Some replacements with unicode lookalikes to fix syntax highlighting issues
+            # (Kept as two str.replace passes: ' (' also drops the space, which str.translate can't do,
+            # and a single regex pass for both is several times slower than the two C-level replaces)
+            embed_description = embed_description.replace(' (', '\uFF08')
+            embed_description = embed_description.replace('(', '\uFF08')
+            embed_description = _DOT_FIX_RE.sub('\u2024', embed_description)
+
+        raw_msg = record.__dict__.get('raw_msg')
+        if raw_msg is not None:
+            # Extra raw payload that can be optionally defined
+            embed_description += '\n>>> ' + raw_msg
+
+        if len(embed_description) > _MAX_DESCRIPTION_LENGTH:
+            truncated_suffix = '...\n(truncated)```'
+            embed_description = embed_description[:_MAX_DESCRIPTION_LENGTH-len(truncated_suffix)] + truncated_suffix
+
+        return Embed(
+            title=embed_title,
+            description=embed_description,
+            colour=embed_colour,
+            timestamp=embed_timestamp,
+        )
+
+
+async def register_discord_handler(channel : GuildChannel, level : int = logging.INFO, max_queue_size : int = 1024) -> None:
+    """
+    Registers and initializes an AsyncQueueHandler together with a CustomEmbedFormatter
+    and adds it to the root logger.
+    Also registers and starts a discord.ext.Loop worker to process / format log records when they appear.
+
+    Parameters
+    ----------
+    channel : discord.GuildChannel
+        Channel to send the message into. (The client should be logged in at time of initialization)
+    level : int
+        The logging level at which the handler should send log messages.
+    max_queue_size : int, optional
+        Maximum number of messages waiting to be sent before the oldest ones get dropped. Defaults to 1024.
+
+    """
+    loop = get_running_loop()
+    handler = AsyncQueueHandler(loop, level, max_queue_size)
+    handler.setFormatter(CustomEmbedFormatter())
+
+    @tasks.loop()
+    async def logging_worker():
+        # Send message to logging channel
+        embed = await handler.async_get()
+        await channel.send(embed=embed)
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    logging_worker.start()
@@ -0,0 +1,43 @@
+# Queue based handlers, kept separate so logging.handlers is only imported when they are used
+# Only imported when needed, by setup_logging or on first access through the jtfo.logging module (see logging.__getattr__)
+import logging
+import logging.handlers
+import copy
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for queues that are read by a QueueListener within the same process.
+
+    The default implementation of `prepare` formats the record with its own formatter and removes
+    the exception information, so the handlers of the listener can't apply their own formatting to it.
+    Since the record never leaves the process, only the message is merged with its arguments
+    (they might change before the listener gets to the record), everything else is kept as is.
+
+    See Also
+    --------
+    setup_logging
+    logging.handlers.QueueHandler
+
+    """
+    def prepare(self, record : logging.LogRecord) -> logging.LogRecord:
+        """
+        Overrides prepare method from logging.handlers.QueueHandler, only merging message and arguments.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            The record to enqueue.
+
+        Returns
+        -------
+        logging.LogRecord
+            A copy of the record, with the merged message and without arguments.
+
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+
+        return record
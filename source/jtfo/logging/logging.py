@@ -1,5 +1,9 @@
-from typing import Any, Union
+from typing import Any, List, Tuple, Union
+import functools
+import importlib.util
 import logging
+import time
+import weakref
 import sys
 import os
 
@@ -22,62 +26,207 @@ def add_logging_level(level_name : str, level_value : int) -> None:
         Value of the new logging level. This needs to be a value that isn't already in use. Default values for the logging module are: 
         NOTSET (0) | DEBUG (10) | INFO (20) | WARNING (30) | ERROR (40) | CRITICAL (50)
 
+    Notes
+    -----
+    The added methods only do work if the level is enabled. Pass arguments separately, like
+    `logger.notice("Value: %s", value)`, instead of formatting the message beforehand,
+    so the message also isn't built for disabled levels.
+
+    If the logging level was already added with the same name and value, nothing is changed.
+
     Warnings
     --------
-    This function doesn't check if the logging level already exists!
+    This function doesn't check if the logging level value is already in use by a different logging level!
 
     """
-    def _for_logging_module(*args, **kwargs):
-        kwargs.setdefault('exc_info', False)
-        kwargs.setdefault('stack_info', False)
-        logging.log(level_value, *args, **kwargs)
-
-    def _for_logger_class(self, msg, *args, **kwargs):
-        if self.isEnabledFor(level_value):
-            kwargs.setdefault('exc_info', False)
-            kwargs.setdefault('stack_info', False)
-            self._log(level_value, msg, args, **kwargs)
-
-    def _for_logger_adapter(self, msg, *args, **kwargs):
-        self.log(level_value, msg, *args, **kwargs)
+    # Values are bound as keyword-only defaults (fast local lookups instead of closure cells)
+    def _for_logging_module(msg, *args, _level_value=level_value, _root_logger=logging.getLogger(), **kwargs):
+        # Same as logging.log(), but skips all work if the level isn't enabled
+        if _root_logger.isEnabledFor(_level_value):
+            if len(_root_logger.handlers) == 0:
+                logging.basicConfig()
+
+            if 'exc_info' not in kwargs: kwargs['exc_info'] = False
+            if 'stack_info' not in kwargs: kwargs['stack_info'] = False
+            _root_logger._log(_level_value, msg, args, **kwargs)
+
+    def _for_logger_class(self, msg, *args, _level_value=level_value, **kwargs):
+        if self.isEnabledFor(_level_value):
+            if 'exc_info' not in kwargs: kwargs['exc_info'] = False
+            if 'stack_info' not in kwargs: kwargs['stack_info'] = False
+            self._log(_level_value, msg, args, **kwargs)
+
+    def _for_logger_adapter(self, msg, *args, _level_value=level_value, **kwargs):
+        self.log(_level_value, msg, *args, **kwargs)
 
     level_name = level_name.upper() # Full uppercase, like INFO or ERROR
     method_name = level_name.lower() # Method name is always lowercase, like .info("") or .error("")
-
-    def _unsafe_add_internal():
-        # Add level and property to logging
-        logging.addLevelName(level_value, level_name)
+    logger_class = logging.getLoggerClass()
+    logger_adapter = logging.LoggerAdapter
+
+    if (
+        getattr(logging, level_name, None) == level_value
+        and logging.getLevelName(level_value) == level_name
+        and hasattr(logging, method_name)
+        and hasattr(logger_class, method_name)
+        and hasattr(logger_adapter, method_name)
+    ):
+        # Already added, don't patch the classes again (that would needlessly reset their attribute caches)
+        return
+
+    # Name functions like regular methods (shows up in tracebacks and reprs)
+    for function, owner_name in (
+        (_for_logging_module, None),
+        (_for_logger_class, logger_class.__qualname__),
+        (_for_logger_adapter, logger_adapter.__qualname__),
+    ):
+        function.__name__ = method_name
+        function.__qualname__ = f"{owner_name}.{method_name}" if owner_name else method_name
+
+    # Add level name (acquires the logging lock by itself)
+    logging.addLevelName(level_value, level_name)
+
+    # logging._lock is a reentrant lock on all supported versions,
+    # so we don't need the _acquireLock() / _releaseLock() helpers that were removed in Python 3.13
+    with logging._lock:
+        # Add property to logging
         setattr(logging, level_name, level_value)
         
         # Add method to logging
-        _for_logging_module.__name__ = method_name # Update __name__ property
         setattr(logging, method_name, _for_logging_module)
         
         # Add method to logger
-        logger_class = logging.getLoggerClass()
-        _for_logger_class.__name__ = method_name # Update __name__ property
         setattr(logger_class, method_name, _for_logger_class)
         
         # Add method to adapter
-        logger_adapter = logging.LoggerAdapter
-        _for_logger_adapter.__name__ = method_name # Update __name__ property
         setattr(logger_adapter, method_name, _for_logger_adapter)
 
-    if sys.version_info >= (3, 13):
-        # Since Python 3.13.0 locking uses context manager
-        with logging._lock:
-            _unsafe_add_internal()
-    
-    else:
-        # Previously it would use _aquireLock() and _releaseLock()
-        logging._acquireLock()
-        try:
-            _unsafe_add_internal()
-        finally:
-            logging._releaseLock()
 
+def _indent(text : str) -> str:
+    """
+    Indents every line of the text by two spaces, like the default formatting of stacktraces.
+
+    Parameters
+    ----------
+    text : str
+        The text to indent.
+
+    Returns
+    -------
+    str
+        The indented text. A trailing newline doesn't start a new indented line.
+
+    """
+    indented = '  ' + text.replace('\n', '\n  ')
+    if text.endswith('\n'):
+        indented = indented[:-2] # Don't indent after trailing newline
+
+    return indented
+
+
+class _BaseFormatter(logging.Formatter):
+    """
+    Base class of CustomFormatter and CustomColourFormatter, implementing their shared formatting logic.
+
+    Subclasses build the log line itself by overriding formatMessage.
+    The ANSI colour codes used for the raw text and the stacktrace are empty, unless set by the subclass.
+
+    """
+    def __init__(self, *args : Any, **kwargs : Any):
+        """
+        Constructor, calling super constructor of logging.Formatter class with the given parameters.
+
+        See Also
+        --------
+        logging.Formatter.__init__
+
+        """
+        super().__init__(*args, **kwargs)
+        self._raw_text_colour = ''
+        self._exc_text_colour = ''
+        self._colour_reset = ''
+        self._asctime_cache : Tuple[int, str] = (-1, '')
+
+    def formatTime(self, record : logging.LogRecord, datefmt : Union[str, None] = None) -> str:
+        """
+        Overrides formatTime method from logging.Formatter, caching the formatted time of the last second,
+        so records logged within the same second don't need to be formatted again.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            LogRecord instance to format the creation time of.
+        datefmt : `str` or `None`, optional
+            The date format to use. Only the date format of this formatter is cached.
+
+        Returns
+        -------
+        str
+            The formatted creation time of the record.
+
+        See Also
+        --------
+        logging.Formatter.formatTime
+
+        """
+        if not datefmt or datefmt != self.datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_asctime = self._asctime_cache # Single tuple, safe to read while another thread updates it
+        if second == cached_second:
+            return cached_asctime
+
+        asctime = time.strftime(datefmt, self.converter(second)) # Same as base class for a date format, without msecs
+        self._asctime_cache = (second, asctime)
+        return asctime
+
+    def format(self, record : logging.LogRecord) -> str:
+        """
+        Overrides format method from logging.Formatter and implements custom formatting logic as
+        described in the class docstrings of CustomFormatter and CustomColourFormatter.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            LogRecord instance containing the logging information to format.
+
+        Returns
+        -------
+        str
+            The formatted logging information as text.
+
+        See Also
+        --------
+        logging.Formatter.format
+
+        """
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        s = self.formatMessage(record)
+
+        raw_text = record.__dict__.get('raw_msg') # Plain dict lookup, raw_msg can only come from the extra-dictionary
+        if raw_text is not None:
+            # Indented raw text, with empty line after
+            s += f'{self._raw_text_colour}\n{_indent(raw_text)}\n{self._colour_reset}'
+
+        if record.exc_info and not record.exc_text:
+            # Cache unmodified stacktrace on the record, so it's only formatted once for all handlers
+            record.exc_text = self.formatException(record.exc_info)
 
-class CustomFormatter(logging.Formatter):
+        if record.exc_text:
+            if s[-1:] != '\n': s += '\n'
+            # Indented stacktrace, with empty line after
+            s += f'{self._exc_text_colour}{_indent(record.exc_text)}\n{self._colour_reset}'
+
+        if record.stack_info:
+            if s[-1:] != '\n': s += '\n'
+            s += self.formatStack(record.stack_info)
+
+        return s
+
+
+class CustomFormatter(_BaseFormatter):
     """
     Custom logging formatter without support for ANSI colour codes.
 
@@ -89,6 +238,8 @@ class CustomFormatter(logging.Formatter):
     If the extra-dictionary is present and contains a 'raw_msg' key with a string value, 
     it will be printed underneath the message formatted similarly to stacktraces,
     also prefixing two spaces before each line, with an additional newline at the end.
+    The record itself is left untouched, apart from the attributes logging.Formatter also sets
+    (message, asctime and the cached, unindented exc_text), so it can be shared with other handlers.
 
     """
     def __init__(self):
@@ -107,52 +258,76 @@ class CustomFormatter(logging.Formatter):
             style='%'
         )
 
-    def format(self, record : logging.LogRecord):
+    def formatMessage(self, record : logging.LogRecord) -> str:
         """
-        Overrides format method from logging.Formatter and implements custom formatting logic as
-        described in class docstring.
+        Overrides formatMessage method from logging.Formatter, building the logging format
+        directly with an f-string instead of %-style substitution of the format string.
 
         Parameters
         ----------
         record : logging.LogRecord
-            LogRecord instance containing the logging information to format.
+            LogRecord instance with message and asctime already set.
 
         Returns
         -------
         str
-            The formatted logging information as text.
+            The formatted log line, without exception or stack information.
 
         See Also
         --------
-        logging.Formatter.format
+        logging.Formatter.formatMessage
 
         """
-        exc_text = None
-        if record.exc_info:
-            exc_text = super().formatException(record.exc_info)
-            exc_text = '  ' + '  '.join(exc_text.splitlines(True)) # Indent error text
-            exc_text = exc_text + '\n' # Empty line after stacktrace
-        
-        raw_text = None
-        if hasattr(record, 'raw_msg'):
-            raw_text = record.raw_msg
-            raw_text = '  ' + '  '.join(raw_text.splitlines(True)) # Indent raw text
-            raw_text = '\n' + raw_text + '\n' # Empty line after raw text
-
-        original_exc_text = record.exc_text
-        original_msg = record.msg
-        try:
-            if exc_text: record.exc_text = exc_text # Set exc_text property to print formatted stacktrace
-            if raw_text: record.msg += raw_text # Append additional raw text
-            return super().format(record) # Format modified record state
-        
-        finally:
-            # Restore original record state
-            record.exc_text = original_exc_text
-            record.msg = original_msg
+        return f"{record.asctime} [{record.levelname:<8}] {record.name}: {record.message}"
+
+
+class _LevelParts(dict):
+    """
+    Lookup table of coloured level names used by CustomColourFormatter, keyed by logging level.
+
+    Values are tuples of level name, ANSI colour code and the already padded and coloured level name.
+    Levels without their own colour are added on their first lookup, using the colour of DEBUG.
+
+    """
+    def __missing__(self, levelno : int) -> Tuple[str, str, str]:
+        c_level = self[logging.DEBUG][1]
+        levelname = logging.getLevelName(levelno)
+        level_parts = self[levelno] = (levelname, c_level, f"{c_level}{levelname:<8}")
+        return level_parts
+
+
+@functools.lru_cache(maxsize=None)
+def _build_level_parts() -> _LevelParts:
+    """
+    Creates the lookup table of coloured level names used by CustomColourFormatter for the logging levels.
+
+    The lookup table is only created once, on first use, and is shared by all CustomColourFormatter instances.
+
+    Returns
+    -------
+    _LevelParts
+        Lookup table for the coloured level names, keyed by logging level.
 
+    """
+    c_levels = {
+        logging.NOTSET:   '\x1b[30;1m',
+        logging.DEBUG:    '\x1b[35;1m',
+        logging.INFO:     '\x1b[37;1m',
+        logging.NOTICE:   '\x1b[32;1m', # Custom logging level
+        logging.WARNING:  '\x1b[33;1m',
+        logging.ERROR:    '\x1b[31;1m',
+        logging.CRITICAL: '\x1b[41;1m',
+    }
+
+    level_parts = _LevelParts()
+    for level, c_level in c_levels.items():
+        levelname = logging.getLevelName(level)
+        level_parts[level] = (levelname, c_level, f"{c_level}{levelname:<8}")
+
+    return level_parts
 
-class CustomColourFormatter(logging.Formatter):
+
+class CustomColourFormatter(_BaseFormatter):
     """
     Custom logging formatter with support for ANSI colour codes.
 
@@ -164,6 +339,8 @@ class CustomColourFormatter(logging.Formatter):
     If the extra-dictionary is present and contains a 'raw_msg' key with a string value, 
     it will be printed underneath the message formatted similarly to stacktraces,
     also prefixing two spaces before each line, with an additional newline at the end.
+    The record itself is left untouched, apart from the attributes logging.Formatter also sets
+    (message, asctime and the cached, unindented exc_text), so it can be shared with other handlers.
 
     The following ANSI colour codes are used to decorate the elements of the log messages:
         Timestamp and punctuation: '\\x1b[30;2m' (black text, dim)
@@ -220,85 +397,59 @@ class CustomColourFormatter(logging.Formatter):
     """
     def __init__(self):
         """
-        Constructor, creating a formatter for each logging level using the specified ANSI colour codes.
+        Constructor, calling super constructor of logging.Formatter class with the date format,
+        and preparing the parts of the logging format using the specified ANSI colour codes.
 
         See Also
         --------
         logging.Formatter.__init__
 
         """
-        c_levels = [
-            (logging.NOTSET,   '\x1b[30;1m'),
-            (logging.DEBUG,    '\x1b[35;1m'),
-            (logging.INFO,     '\x1b[37;1m'),
-            (logging.NOTICE,   '\x1b[32;1m'), # Custom logging level
-            (logging.WARNING,  '\x1b[33;1m'),
-            (logging.ERROR,    '\x1b[31;1m'),
-            (logging.CRITICAL, '\x1b[41;1m'),
-        ]
+        super().__init__(datefmt='%Y-%m-%d %H:%M:%S')
+
         c_accent = '\x1b[90m'
         c_name   = '\x1b[34m'
         c_reset  = '\x1b[0m'
 
-        self._formatters = {}
-        for level, c_level in c_levels:
-            self._formatters[level] = logging.Formatter(
-                f"{c_accent}%(asctime)s [{c_reset}{c_level}%(levelname)-8s{c_reset}{c_accent}] " \
-                f"{c_reset}{c_name}%(name)s{c_reset}{c_accent}: {c_reset}%(message)s",
-                '%Y-%m-%d %H:%M:%S',
-                style='%'
-            )
+        self._level_parts = _build_level_parts()
+        self._asctime_prefix = c_accent
+        self._levelname_prefix = f" [{c_reset}"
+        self._levelname_suffix = f"{c_reset}{c_accent}] {c_reset}{c_name}"
+        self._name_suffix = f"{c_reset}{c_accent}: {c_reset}"
+        self._raw_text_colour = '\x1b[36m' # Cyan
+        self._exc_text_colour = '\x1b[31m' # Red
+        self._colour_reset = c_reset
 
-    def format(self, record : logging.LogRecord) -> str:
+    def formatMessage(self, record : logging.LogRecord) -> str:
         """
-        Overrides format method from logging.Formatter and implements custom formatting logic as
-        described in class docstring.
+        Overrides formatMessage method from logging.Formatter, building the coloured logging format
+        directly from its prepared parts instead of using a format string.
 
         Parameters
         ----------
         record : logging.LogRecord
-            LogRecord instance containing the logging information to format.
+            LogRecord instance with message and asctime already set.
 
         Returns
         -------
         str
-            The formatted logging information as text.
+            The formatted log line, without exception or stack information.
 
         See Also
         --------
-        logging.Formatter.format
+        logging.Formatter.formatMessage
 
         """
-        formatter = self._formatters.get(record.levelno, self._formatters[logging.DEBUG])
-        
-        exc_text = None
-        if record.exc_info:
-            exc_text = formatter.formatException(record.exc_info)
-            exc_text = '  ' + '  '.join(exc_text.splitlines(True)) # Indent error text
-            exc_text = exc_text + '\n' # Empty line after stacktrace
-            exc_text = f'\x1b[31m{exc_text}\x1b[0m' # Add color red
-        
-        raw_text = None
-        if hasattr(record, 'raw_msg'):
-            raw_text = record.raw_msg
-            raw_text = '  ' + '  '.join(raw_text.splitlines(True)) # Indent raw text
-            raw_text = '\n' + raw_text + '\n' # Empty line after raw text
-            raw_text = f'\x1b[36m{raw_text}\x1b[0m' # Add color cyan
-
-        original_exc_text = record.exc_text
-        original_msg = record.msg
-        try:
-            if exc_text: record.exc_text = exc_text # Set exc_text property to print formatted stacktrace
-            if raw_text: record.msg += raw_text # Append additional raw text
+        levelname, c_level, level_part = self._level_parts[record.levelno]
+        if record.levelname != levelname:
+            # Level name differs from the prepared one (renamed after it was added to the lookup table)
+            level_part = f"{c_level}{record.levelname:<8}"
 
-            return formatter.format(record) # Format modified record state
-        
-        finally:
-            # Restore original record state
-            record.exc_text = original_exc_text
-            record.msg = original_msg
+        return f"{self._asctime_prefix}{record.asctime}{self._levelname_prefix}{level_part}" \
+            f"{self._levelname_suffix}{record.name}{self._name_suffix}{record.message}"
 
 
+@functools.lru_cache(maxsize=None)
 def is_docker() -> bool:
     """
     Determine if the current environment is running in a docker container.
@@ -308,6 +459,10 @@ def is_docker() -> bool:
     bool
         Whether or not the current environment is running in a docker container.
 
+    Notes
+    -----
+    The result is cached, since it can't change during the lifetime of the process.
+
     References
     ----------
     This class was taken from https://github.com/Rapptz/discord.py/blob/master/discord/utils.py.
@@ -337,8 +492,27 @@ def is_docker() -> bool:
     DEALINGS IN THE SOFTWARE.    
     
     """
-    path = '/proc/self/cgroup'
-    return os.path.exists('/.dockerenv') or (os.path.isfile(path) and any('docker' in line for line in open(path)))
+    if os.path.exists('/.dockerenv'):
+        return True
+
+    try:
+        # Read in one go and search the raw bytes, closing the file handle afterwards
+        with open('/proc/self/cgroup', 'rb') as f:
+            return b'docker' in f.read()
+
+    except OSError:
+        return False
+
+
+# Colour related environment of the process, only checked once on import
+# Pycharm and Vscode support colour in their inbuilt editors
+_IS_IDE_TERMINAL = 'PYCHARM_HOSTED' in os.environ or os.environ.get('TERM_PROGRAM') == 'vscode'
+# ANSICON checks for things like ConEmu
+# WT_SESSION checks if this is Windows Terminal
+_IS_WINDOWS_ANSI_TERMINAL = 'ANSICON' in os.environ or 'WT_SESSION' in os.environ
+
+# Results of stream_supports_colour, kept only as long as the streams themselves are alive
+_STREAM_SUPPORTS_COLOUR_CACHE : 'weakref.WeakKeyDictionary[Any, bool]' = weakref.WeakKeyDictionary()
 
 
 def stream_supports_colour(stream: Any) -> bool:
@@ -355,6 +529,12 @@ def stream_supports_colour(stream: Any) -> bool:
     bool
         Whether or not the stream supports color.
 
+    Notes
+    -----
+    The result is cached per stream, without keeping the stream alive.
+    Streams that can't be weakly referenced (or aren't hashable) are checked again every time.
+    Environment variables are only read once, when this module is imported.
+
     References
     ----------
     This class was taken from https://github.com/Rapptz/discord.py/blob/master/discord/utils.py.
@@ -383,20 +563,41 @@ def stream_supports_colour(stream: Any) -> bool:
     FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
     DEALINGS IN THE SOFTWARE.
 
+    """
+    try:
+        return _STREAM_SUPPORTS_COLOUR_CACHE[stream]
+
+    except KeyError:
+        supports_colour = _check_stream_supports_colour(stream)
+        _STREAM_SUPPORTS_COLOUR_CACHE[stream] = supports_colour
+        return supports_colour
+
+    except TypeError:
+        # Can't be used as a weak key, don't cache
+        return _check_stream_supports_colour(stream)
+
+
+def _check_stream_supports_colour(stream: Any) -> bool:
+    """
+    Uncached implementation of stream_supports_colour.
+
+    See Also
+    --------
+    stream_supports_colour
+
     """
     is_a_tty = hasattr(stream, 'isatty') and stream.isatty()
 
     # Pycharm and Vscode support colour in their inbuilt editors
-    if 'PYCHARM_HOSTED' in os.environ or os.environ.get('TERM_PROGRAM') == 'vscode':
+    if _IS_IDE_TERMINAL:
         return is_a_tty
 
     if sys.platform != 'win32':
         # Docker does not consistently have a tty attached to it
         return is_a_tty or is_docker()
 
-    # ANSICON checks for things like ConEmu
-    # WT_SESSION checks if this is Windows Terminal
-    return is_a_tty and ('ANSICON' in os.environ or 'WT_SESSION' in os.environ)
+    # ANSICON or Windows Terminal
+    return is_a_tty and _IS_WINDOWS_ANSI_TERMINAL
 
 
 def get_handler(use_colour_if_supported : bool = True) -> logging.StreamHandler:
@@ -427,7 +628,45 @@ def get_handler(use_colour_if_supported : bool = True) -> logging.StreamHandler:
     return handler
 
 
-def setup_logging(file_path : Union[str, None] = None, file_log_level : int = logging.INFO, use_colour_if_supported : bool = True) -> None:
+def get_buffered_handler(handler : logging.Handler, capacity : int = 1024, flush_level : int = logging.ERROR, flush_interval : Union[float, None] = None) -> 'BufferedHandler':
+    """
+    Returns a BufferedHandler buffering log records for the given handler.
+
+    The buffered records are written to the stream of the handler all at once, once the buffer is full,
+    or as soon as a record with `flush_level` or above is logged.
+    The buffer is also flushed when it gets closed, for example by `logging.shutdown` at exit.
+
+    Parameters
+    ----------
+    handler : logging.Handler
+        The handler the buffered records are written with.
+        Only writes to the stream of a `logging.StreamHandler` or `logging.FileHandler` are batched.
+        Other handlers, including subclasses with their own emit like `logging.handlers.RotatingFileHandler`,
+        get the buffered records passed on one by one.
+    capacity : int, optional
+        Number of records to buffer before they are written. Defaults to 1024.
+    flush_level : int, optional
+        Logging level at which the buffer is written immediately. Defaults to `logging.ERROR`.
+    flush_interval : `float` or `None`, optional
+        If set, the buffer is also written every `flush_interval` seconds,
+        by a thread that is stopped when the BufferedHandler is closed. Defaults to `None`.
+
+    Returns
+    -------
+    BufferedHandler
+        The newly created BufferedHandler, using the same logging level as the handler.
+        (The handler's logging level isn't checked again when writing the buffered records)
+
+    """
+    from ._buffer import BufferedHandler # Only imported when needed
+
+    buffered_handler = BufferedHandler(capacity, flush_level, handler, flush_interval)
+    buffered_handler.setLevel(handler.level)
+
+    return buffered_handler
+
+
+def setup_logging(file_path : Union[str, None] = None, file_log_level : int = logging.INFO, use_colour_if_supported : bool = True, buffered : bool = False, async_logging : bool = False) -> None:
     """
     Function to setup logging configuration. Should only be called once at startup.
 
@@ -439,12 +678,22 @@ def setup_logging(file_path : Union[str, None] = None, file_log_level : int = lo
         Which logging level the file handler should use. Defaults to `logging.INFO`.
     use_colour_if_supported : `bool`, optional
         Whether to consider using CustomColourFormatter.
+    buffered : `bool`, optional
+        Whether to buffer log records in memory and write them in batches, with a single write to the stream per batch.
+        Buffers are written every 0.2 seconds, when they are full, or immediately for `logging.ERROR` and above.
+        Defaults to `False`.
+    async_logging : `bool`, optional
+        Whether to format and write log records on a separate thread, so logging calls return immediately.
+        Messages are still merged with their arguments by the calling thread, before the record is queued. Defaults to `False`.
 
     Info
     ----
     For root logger, sets up a logging handler with either `CustomColourFormatter` as formatter 
     if the logging stream supports ANSI colour codes, or `CustomFormatter` if it doesn't.
     Optionally attaches a `FileHandler` to the root logger, using `CustomFormatter`.
+    If buffered, each handler is wrapped into a `BufferedHandler` (see `get_buffered_handler`).
+    If async_logging, only a `LocalQueueHandler` is attached to the root logger, and the handlers are
+    run by a `QueueListener`, which is stopped (processing all remaining records) at exit.
     Sets the logging level of the root logger to `logging.DEFAULT`.
     Lastly, adds a callback for `sys.excepthook` to allow our modified root logger to log
     exceptions on root level using `logging.CRITICAL` as log level.
@@ -452,16 +701,36 @@ def setup_logging(file_path : Union[str, None] = None, file_log_level : int = lo
     """
     add_logging_level("NOTICE", 25) # Custom logging level. like INFO, but meant to be prominently displayed as a notification
 
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(get_handler(use_colour_if_supported))
+    handlers = [ get_handler(use_colour_if_supported) ]
 
     if file_path:
         # Also set up file logger
         file_handler = logging.FileHandler(file_path)
         file_handler.setLevel(file_log_level)
         file_handler.setFormatter(CustomFormatter())
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if buffered:
+        # Batch writes, but still flush regularly to keep output responsive
+        handlers = [ get_buffered_handler(handler, flush_interval=0.2) for handler in handlers ]
+
+    if async_logging:
+        # Move formatting and writing to the listener thread
+        from logging.handlers import QueueListener # Only imported when needed
+        from queue import SimpleQueue
+        from ._queue import LocalQueueHandler
+        import atexit
+
+        queue = SimpleQueue()
+        listener = QueueListener(queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop) # Runs before logging.shutdown, which was registered first
+        handlers = [ LocalQueueHandler(queue) ]
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    for handler in handlers:
+        root_logger.addHandler(handler)
 
     # Handle uncaught exceptions with logger as well
     def _handle_uncaught_exception(exc_type : Any, exc_value : Any, exc_traceback : Any) -> None:
@@ -473,200 +742,83 @@ def setup_logging(file_path : Union[str, None] = None, file_log_level : int = lo
     sys.excepthook = _handle_uncaught_exception
 
 
-try:
-    # Extra functionality for "discord.py" if available
-    from discord.abc import GuildChannel
-    from discord import Embed, Colour
-    from discord.ext import tasks
-
-    from asyncio import get_running_loop, run_coroutine_threadsafe, AbstractEventLoop, Queue
-    from datetime import datetime
-    from re import sub
-
-
-    class AsyncQueueHandler(logging.Handler):
-        """
-        Logging handler emitting log records into internal asyncio.Queue instance.
-        Queue has to be read externally using async_get.
-
-        Used together with the CustomEmbedFormatter to create formatted message 
-        logging for use with Discord.py bots.
-        
-        Warnings
-        --------
-        The queue size isn't limited, and there is no mechanism to prevent it from filling up faster than messages are taken out.
-        The implementation is responsible for calling async_get to get elements from the queue fast enough.
-        This probably isn't suited for high-performance logging, but it should be fine for the purpose of occasionally logging
-        formatted messages to a Discord channel.
-
-        See Also
-        --------
-        register_discord_handlers
-        register_discord_handler
-        logging.Handler
-        asyncio.Queue
-
-        """
-        def __init__(self, loop : AbstractEventLoop, level : int):
-            """
-            Initialized async queue and calls super constructur.
-
-            Parameters
-            ----------
-            loop : AbstractEventLoop
-                The asyncio event loop to use (threadsafe) when putting into the queue / emitting log records.
-            level : int
-                Minimum logging level for which to emit logging records, passed to super constructor.
-
-            """
-            self._loop : AbstractEventLoop = loop
-            self._queue : Queue = Queue()
-            super().__init__(level)
-
-        def emit(self, record : logging.LogRecord) -> None:
-            """
-            Called when a record has a high enough level to be sent.
-            As long as the loop isn't closed, formats record and puts the resulting message
-            into the async queue.
-
-            Parameters
-            ----------
-            record : logging.LogRecord
-                The record to be formatted and logged.
-
-            """
-            if self._loop.is_closed(): return
+# Names provided by submodules, which are only imported when first accessed
+_LAZY_NAMES = {
+    # Extra functionality for "discord.py", if available
+    'AsyncQueueHandler': '_discord',
+    'CustomEmbedFormatter': '_discord',
+    'register_discord_handler': '_discord',
+    # Depend on logging.handlers
+    'BufferedHandler': '_buffer',
+    'LocalQueueHandler': '_queue',
+}
+
+__all__ = [
+    'add_logging_level',
+    'CustomFormatter',
+    'CustomColourFormatter',
+    'is_docker',
+    'stream_supports_colour',
+    'get_handler',
+    'get_buffered_handler',
+    'setup_logging',
+    'BufferedHandler',
+    'LocalQueueHandler',
+]
+
+if importlib.util.find_spec('discord') is not None:
+    # Only exported if discord.py is available (finding it doesn't import it yet)
+    __all__ += [
+        'AsyncQueueHandler',
+        'CustomEmbedFormatter',
+        'register_discord_handler',
+    ]
+
+
+def __getattr__(name : str) -> Any:
+    """
+    Lazily provides the names of submodules, so importing this module doesn't pay
+    for importing logging.handlers, or discord.py and asyncio if available.
 
-            msg : Any = self.format(record)
-            run_coroutine_threadsafe(self._queue.put(msg), self._loop)
+    Parameters
+    ----------
+    name : str
+        Name of the attribute that wasn't found in the module.
 
-        async def async_get(self) -> Any:
-            """
-            Retrieves the next log message from the async queue.
-            If there is none, will wait until one is available.
+    Returns
+    -------
+    Any
+        The requested attribute from the submodule providing it.
 
-            See Also
-            --------
-            Queue.get
+    Raises
+    ------
+    AttributeError
+        If the attribute doesn't exist, or discord.py isn't available.
 
-            """
-            return await self._queue.get()
+    """
+    module_name = _LAZY_NAMES.get(name)
+    if module_name:
+        try:
+            module = importlib.import_module(f'.{module_name}', __package__)
 
+        except ImportError:
+            # Discord.py not available
+            pass
 
-    class CustomEmbedFormatter(logging.Formatter):
-        """
-        Custom embed formatter for logging to Discord channels.
+        else:
+            return getattr(module, name)
 
-        Used together with AsyncQueueHandler to create formatted message 
-        logging for use with Discord.py bots.
-        
-        Info
-        ----
-        The embeds are formatted to make them visually more appealing.
-        First, the colour for the embed is chosen based on the log level:
-            NOTSET   (0) : Colour.dark_gray()
-            DEBUG    (10): Colour.purple()
-            INFO     (20): Colour.default()
-            NOTICE   (25): Colour.green()
-            WARNING  (30): Colour.yellow()
-            ERROR    (40): Colour.red()
-            CRITICAL (50): Colour.dark_red()
-        The log level name and the name of the logger are set as the embed's title.
-        The created date of the record is turned into a timezone-aware timestamp and will
-        display at the bottom of each embed.
-        Lastly, the description is put into a code box, using 'profile' as the language for highlighting.
-        If the record contains exc_info it will be appended in a second text box, also using 'profile' for highlighting.
-        If the extra-dictionary is present and contains a 'raw_msg' key with a string value, 
-        it will be appended to the embed description as a multi-line quote.
-        That way, custom formatting for it can still be rendered if necessary.
-
-        Warning
-        -------
-        To fix some issues with Discord's syntax highlighting for 'profile',
-        a couple of characters get replaced with lookalikes in the text contents:
-            ' ('        -> '\uFF08' (Fullwidth left parenthesis)
-            '('         -> '\uFF08' (Fullwidth left parenthesis)
-            r'\.(?=\D)' -> '\u2024' (One-dot leader)
-        This is fine for displaying, but needs to be considered before doing anything
-        else with the messages!
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-        """
-        def __init__(self):
-            self._level_colours = {
-                logging.NOTSET:   Colour.dark_gray(),
-                logging.DEBUG:    Colour.purple(),
-                logging.INFO:     Colour.default(),
-                logging.NOTICE:   Colour.green(), # Custom logging level
-                logging.WARNING:  Colour.yellow(),
-                logging.ERROR:    Colour.red(),
-                logging.CRITICAL: Colour.dark_red(),
-            }
-
-        def format(self, record : logging.LogRecord) -> Embed:
-            embed_title = f"**{record.levelname}** - {record.name}"
-            embed_colour = self._level_colours.get(record.levelno)
-            embed_timestamp = datetime.fromtimestamp(record.created, datetime.now().astimezone().tzinfo)
-            embed_description = ''
-
-            message = record.getMessage()
-            if len(message) > 0:
-                embed_description += f"```profile\n{message}```" # Replace number sign
-            
-            if record.exc_info:
-                # Add stacktrace as textbox
-                exc_text = self.formatException(record.exc_info)
-                embed_description += f"```profile\n{exc_text}```"
-
-            if len(embed_description) > 0:
-                # Hack: Some replacements with unicode lookalikes to fix syntax highlighting issues
-                embed_description = embed_description.replace(' (', '\uFF08')
-                embed_description = embed_description.replace('(', '\uFF08')
-                embed_description = sub(r'\.(?=\D)', '\u2024', embed_description)
-
-            if hasattr(record, 'raw_msg'):
-                # Extra raw payload that can be optionally defined
-                embed_description += '\n>>> ' + record.raw_msg
-
-            if len(embed_description) > 4096:
-                truncated_suffix = '...\n(truncated)```'
-                embed_description = embed_description[:4096-len(truncated_suffix)] + truncated_suffix
-
-            return Embed(
-                title=embed_title,
-                description=embed_description,
-                colour=embed_colour,
-                timestamp=embed_timestamp,
-            )
-
-
-    async def register_discord_handler(channel : GuildChannel, level : int = logging.INFO) -> None:
-        """
-        Registers and initializes an AsyncQueueHandler together with a CustomEmbedFormatter
-        and adds it to the root logger.
-        Also registers and starts a discord.ext.Loop worker to process / format log records when they appear.
 
-        Parameters
-        ----------
-        channel : discord.GuildChannel
-            Channel to send the message into. (The client should be logged in at time of initialization)
-        level : int
-            The logging level at which the handler should send log messages.
+def __dir__() -> List[str]:
+    """
+    Lists the names of the module, including the ones provided lazily by submodules.
 
-        """
-        loop = get_running_loop()
-        handler = AsyncQueueHandler(loop, level)
-        handler.setFormatter(CustomEmbedFormatter())
-
-        @tasks.loop()
-        async def logging_worker():
-            # Send message to logging channel
-            embed = await handler.async_get()
-            await channel.send(embed=embed)
-        
-        root_logger = logging.getLogger()
-        root_logger.addHandler(handler)
-        logging_worker.start()
+    Returns
+    -------
+    List[str]
+        The sorted names of the module.
 
-except ImportError:
-    # Discord.py not available
-    pass
\ No newline at end of file
+    """
+    return sorted(set(globals()) | set(__all__))